@@ -0,0 +1,120 @@
+"""Check the shared rate budget with parallel worker processes and a stub API.
+
+Starts a local HTTP server that enforces a per-token limit over a sliding
+window, then runs several processes that each send requests through their own
+ClickUpClient with a common rate-limit state directory. Prints the busiest
+window the server saw and exits non-zero if the limit was exceeded, the server
+answered 429, or a worker failed.
+
+    uv run python scripts/check_rate_limit.py --workers 4 --rate 10 --period 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Process
+from pathlib import Path
+
+from clickup_cli.client import ClickUpClient
+from clickup_cli.ratelimit import RateLimiter
+
+
+class StubAPI(ThreadingHTTPServer):
+    """Answers every GET with an empty team list, or 429 once ``limit`` is hit."""
+
+    def __init__(self, limit: int, period: float):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.limit = limit
+        self.period = period
+        self.accepted: list[float] = []
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def admit(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            recent = [t for t in self.accepted if t > now - self.period]
+            if len(recent) >= self.limit:
+                self.rejected += 1
+                return False
+            self.accepted.append(now)
+            return True
+
+    def busiest_window(self) -> int:
+        """Most requests accepted within any ``period`` seconds."""
+        times = sorted(self.accepted)
+        busiest = start = 0
+        for end, t in enumerate(times):
+            while times[start] <= t - self.period:
+                start += 1
+            busiest = max(busiest, end - start + 1)
+        return busiest
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubAPI
+
+    def do_GET(self):
+        admitted = self.server.admit()
+        body = json.dumps({"teams": []} if admitted else {"err": "Rate limit reached"}).encode()
+        self.send_response(200 if admitted else 429)
+        if not admitted:
+            self.send_header("Retry-After", str(max(1, round(self.server.period))))
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def worker(base_url: str, state_dir: str, rate: int, period: float, requests: int) -> None:
+    limiter = RateLimiter("stub-token", rate=rate, period=period, state_dir=Path(state_dir))
+    client = ClickUpClient("stub-token", rate_limiter=limiter, base_url=base_url)
+    for _ in range(requests):
+        client.get_teams()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=15, help="Requests sent by each worker.")
+    parser.add_argument("--rate", type=int, default=10, help="Requests allowed per period.")
+    parser.add_argument("--period", type=float, default=1.0, help="Window length in seconds.")
+    args = parser.parse_args()
+
+    server = StubAPI(args.rate, args.period)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        started = time.monotonic()
+        workers = [
+            Process(target=worker, args=(base_url, state_dir, args.rate, args.period, args.requests))
+            for _ in range(args.workers)
+        ]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+        elapsed = time.monotonic() - started
+    server.shutdown()
+
+    failed = sum(p.exitcode != 0 for p in workers)
+    busiest = server.busiest_window()
+    print(
+        f"{len(server.accepted)} requests in {elapsed:.1f}s; busiest {args.period:g}s window: "
+        f"{busiest}/{args.rate}; 429s: {server.rejected}; failed workers: {failed}"
+    )
+    return 1 if failed or server.rejected or busiest > args.rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
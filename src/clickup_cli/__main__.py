@@ -0,0 +1,3 @@
+from clickup_cli.cli import cli
+
+cli()
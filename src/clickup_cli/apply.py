@@ -0,0 +1,207 @@
+"""Declarative task state: diff a YAML spec against ClickUp and send only changes.
+
+A spec file looks like::
+
+    list: "@sprint42"        # optional: fetch these tasks a page at a time
+    tasks:
+      - id: abc123
+        status: in progress
+        priority: high       # urgent/high/normal/low or 1-4, null to clear
+        assignees: [12345]   # user IDs; the full desired set
+        due_date: 2025-06-01 # null to clear
+        time_estimate: 2h
+        tags: [backend]
+
+Only the fields given for a task are compared. Tasks whose list is known are
+fetched through the list's task pages (up to 100 tasks per request); the rest
+are fetched individually on a thread pool.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+import yaml
+
+from clickup_cli.client import ClickUpClient
+from clickup_cli.formatting import PRIORITY_RANK, _format_time_estimate
+from clickup_cli.helpers import parse_due_date, parse_time_estimate, resolve_alias
+from clickup_cli.models import Task
+
+FIELDS = {"id", "list", "name", "description", "status", "priority", "assignees", "due_date", "time_estimate", "tags"}
+
+
+@dataclass
+class TaskChange:
+    task_id: str
+    name: str
+    payload: dict = field(default_factory=dict)
+    add_tags: list[str] = field(default_factory=list)
+    remove_tags: list[str] = field(default_factory=list)
+    # (field, current, desired) for display.
+    diffs: list[tuple[str, str, str]] = field(default_factory=list)
+
+    @property
+    def requests(self) -> int:
+        return bool(self.payload) + len(self.add_tags) + len(self.remove_tags)
+
+
+def load_spec(path: str) -> list[dict]:
+    """Read and validate a spec file, resolving list aliases."""
+    with open(path) as f:
+        try:
+            spec = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Could not parse {path}: {e}")
+    if isinstance(spec, list):
+        spec = {"tasks": spec}
+    if not isinstance(spec, dict) or not isinstance(spec.get("tasks") or [], list):
+        raise ValueError(f"{path} must contain a 'tasks' list or a list of tasks.")
+    default_list = spec.get("list")
+    entries = []
+    for i, entry in enumerate(spec.get("tasks") or [], 1):
+        if not isinstance(entry, dict) or "id" not in entry:
+            raise ValueError(f"Task #{i} in {path} has no 'id'.")
+        unknown = set(entry) - FIELDS
+        if unknown:
+            raise ValueError(f"Task {entry['id']} has unknown field(s): {', '.join(sorted(unknown))}.")
+        entry = _normalise({**entry, "id": str(entry["id"])})
+        list_id = entry.get("list", default_list)
+        if list_id:
+            entry["list"] = resolve_alias(str(list_id), "list")
+        entries.append(entry)
+    return entries
+
+
+def _normalise(entry: dict) -> dict:
+    """Check a task's desired values and convert them to the types ClickUp returns."""
+    task_id = entry["id"]
+    for key in ("name", "description"):
+        if entry.get(key) is not None:
+            entry[key] = str(entry[key])
+    if "priority" in entry:
+        try:
+            _priority(entry["priority"])
+        except ValueError:
+            raise ValueError(
+                f"Task {task_id}: invalid priority '{entry['priority']}'. Use urgent/high/normal/low or 1-4."
+            )
+    if "assignees" in entry:
+        assignees = entry["assignees"] or []
+        if not isinstance(assignees, list):
+            raise ValueError(f"Task {task_id}: 'assignees' must be a list of user IDs.")
+        for a in assignees:
+            if isinstance(a, bool) or not str(a).isdigit():
+                raise ValueError(f"Task {task_id}: invalid assignee '{a}'. Use numeric user IDs.")
+        entry["assignees"] = [int(a) for a in assignees]
+    return entry
+
+
+def fetch_current(client: ClickUpClient, entries: list[dict], workers: int = 8) -> dict[str, Task]:
+    """Current state of every task referenced by ``entries``, keyed by ID."""
+    wanted = {e["id"] for e in entries}
+    by_list: dict[str, set[str]] = {}
+    for e in entries:
+        if e.get("list"):
+            by_list.setdefault(e["list"], set()).add(e["id"])
+
+    current: dict[str, Task] = {}
+    for list_id, ids in by_list.items():
+        for _, tasks, _ in client.iter_task_pages(list_id, include_closed=True, subtasks=True):
+            current.update((t.id, t) for t in tasks if t.id in ids)
+            if ids <= current.keys():
+                break
+
+    missing = sorted(wanted - current.keys())
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for task in pool.map(client.get_task, missing):
+            current[task.id] = task
+    return current
+
+
+def _priority(value) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, int) and value in PRIORITY_RANK.values():
+        return value
+    if str(value).lower() in PRIORITY_RANK:
+        return PRIORITY_RANK[str(value).lower()]
+    raise ValueError(f"Invalid priority '{value}'. Use urgent/high/normal/low or 1-4.")
+
+
+def _local_date(ms: str | None) -> str | None:
+    if not ms:
+        return None
+    return datetime.fromtimestamp(int(ms) / 1000).astimezone().strftime("%Y-%m-%d")
+
+
+def diff_task(current: Task, desired: dict) -> TaskChange:
+    """The minimal update that brings ``current`` to ``desired``."""
+    change = TaskChange(task_id=current.id, name=current.name)
+
+    def differs(key: str, old, new, shown_old=None, shown_new=None) -> None:
+        if old != new:
+            change.payload[key] = new
+            change.diffs.append((key, str(old if shown_old is None else shown_old), str(new if shown_new is None else shown_new)))
+
+    for key in ("name", "description"):
+        if key in desired:
+            differs(key, getattr(current, key) or "", desired[key] or "")
+    if "status" in desired and current.status.lower() != str(desired["status"]).lower():
+        change.payload["status"] = desired["status"]
+        change.diffs.append(("status", current.status, str(desired["status"])))
+    if "priority" in desired:
+        new = _priority(desired["priority"])
+        old = PRIORITY_RANK.get(current.priority or "")
+        differs("priority", old, new, shown_old=current.priority or "-", shown_new=desired["priority"] or "-")
+    if "due_date" in desired:
+        new = desired["due_date"]
+        new = new.isoformat() if isinstance(new, date) else new
+        old = _local_date(current.due_date)
+        if old != new:
+            change.payload["due_date"] = parse_due_date(new) if new else None
+            change.diffs.append(("due_date", old or "-", new or "-"))
+    if "time_estimate" in desired:
+        raw = desired["time_estimate"]
+        new = parse_time_estimate(str(raw)) if raw else None
+        if (current.time_estimate or None) != new:
+            change.payload["time_estimate"] = new
+            change.diffs.append(
+                ("time_estimate", _format_time_estimate(current.time_estimate), _format_time_estimate(new))
+            )
+    if "assignees" in desired:
+        new = set(desired["assignees"])
+        old = set(current.assignee_ids)
+        delta = {}
+        if new - old:
+            delta["add"] = sorted(new - old)
+        if old - new:
+            delta["rem"] = sorted(old - new)
+        if delta:
+            change.payload["assignees"] = delta
+            change.diffs.append(("assignees", ", ".join(map(str, sorted(old))) or "-", ", ".join(map(str, sorted(new))) or "-"))
+    if "tags" in desired:
+        # ClickUp stores tag names in lowercase.
+        new = {str(t).lower() for t in desired["tags"] or []}
+        old = {t.lower() for t in current.tags}
+        change.add_tags = sorted(new - old)
+        change.remove_tags = sorted(old - new)
+        if new != old:
+            change.diffs.append(("tags", ", ".join(sorted(old)) or "-", ", ".join(sorted(new)) or "-"))
+    return change
+
+
+def plan(client: ClickUpClient, entries: list[dict]) -> list[TaskChange]:
+    current = fetch_current(client, entries)
+    return [diff_task(current[e["id"]], e) for e in entries]
+
+
+def apply_change(client: ClickUpClient, change: TaskChange) -> None:
+    if change.payload:
+        client.update_task(change.task_id, change.payload)
+    for tag in change.add_tags:
+        client.add_tag(change.task_id, tag)
+    for tag in change.remove_tags:
+        client.remove_tag(change.task_id, tag)
@@ -1,19 +1,24 @@
 import click
 
 from clickup_cli.commands.alias import alias_group
+from clickup_cli.commands.apply import apply_cmd
 from clickup_cli.commands.config_cmd import config_group
+from clickup_cli.commands.export import export_cmd
 from clickup_cli.commands.folder import folder_group
 from clickup_cli.commands.list import list_group
+from clickup_cli.commands.queue_cmd import queue_group
 from clickup_cli.commands.space import space_group
 from clickup_cli.commands.task import task_group
 
 
 @click.group()
 @click.version_option()
+@click.option("--profile", default=None, envvar="CLICKUP_PROFILE", help="Config profile to use.")
 @click.pass_context
-def cli(ctx):
+def cli(ctx, profile):
     """CLI tool for managing ClickUp tasks."""
     ctx.ensure_object(dict)
+    ctx.obj["profile"] = profile
 
 
 cli.add_command(alias_group)
@@ -22,3 +27,6 @@ cli.add_command(space_group)
 cli.add_command(folder_group)
 cli.add_command(list_group)
 cli.add_command(task_group)
+cli.add_command(queue_group)
+cli.add_command(export_cmd)
+cli.add_command(apply_cmd)
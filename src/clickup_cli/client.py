@@ -1,47 +1,112 @@
 from __future__ import annotations
 
 import sys
+import time
+from typing import Iterator
+from urllib.parse import quote
 
 import httpx
 from rich.console import Console
 
 from clickup_cli.models import Folder, Space, Task, TaskList
+from clickup_cli.ratelimit import RateLimiter
 
 console = Console()
 
 BASE_URL = "https://api.clickup.com/api/v2"
 
+# How often a rate-limited request is retried before giving up.
+RATE_LIMIT_RETRIES = 3
+
+
+class ClickUpAPIError(Exception):
+    """A request to the ClickUp API failed.
+
+    ``status_code`` is ``None`` when no response arrived. ``maybe_delivered``
+    is set when the request may still have reached ClickUp (e.g. a read
+    timeout), so resending it could apply it twice.
+    """
+
+    def __init__(self, message: str, status_code: int | None = None, maybe_delivered: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.maybe_delivered = maybe_delivered
+
+    @property
+    def retryable(self) -> bool:
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
 
 class ClickUpClient:
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, rate_limiter: RateLimiter | None = None, base_url: str = BASE_URL):
         self._client = httpx.Client(
-            base_url=BASE_URL,
+            base_url=base_url,
             headers={"Authorization": api_token},
             timeout=30.0,
         )
-
-    def _request(self, method: str, path: str, **kwargs) -> dict:
-        try:
-            response = self._client.request(method, path, **kwargs)
-        except httpx.ConnectError:
-            console.print("[red]Could not reach ClickUp API. Check your connection.[/red]")
-            sys.exit(1)
+        self._rate_limiter = rate_limiter or RateLimiter(api_token)
+
+    @staticmethod
+    def _rate_limit_reset(response: httpx.Response) -> float:
+        """When the API will accept requests again, as epoch seconds."""
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            return float(reset)
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return time.time() + int(retry_after)
+        return time.time() + 60
+
+    def _send(self, method: str, path: str, **kwargs) -> dict:
+        """Send a request, raising ClickUpAPIError instead of exiting.
+
+        A 429 empties the shared rate budget until the API's reset time, so
+        every process backs off, and the request is retried.
+        """
+        for _ in range(RATE_LIMIT_RETRIES + 1):
+            self._rate_limiter.acquire()
+            try:
+                response = self._client.request(method, path, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                # The request never left this machine.
+                raise ClickUpAPIError("Could not reach ClickUp API. Check your connection.")
+            except httpx.TransportError as e:
+                raise ClickUpAPIError(
+                    f"No response from ClickUp API ({type(e).__name__}). The request may have been applied.",
+                    maybe_delivered=True,
+                )
+            limit = response.headers.get("X-RateLimit-Limit")
+            if limit and limit.isdigit():
+                self._rate_limiter.update_rate(int(limit))
+            if response.status_code != 429:
+                break
+            self._rate_limiter.backoff(self._rate_limit_reset(response))
 
         if response.status_code == 401:
-            console.print("[red]Authentication failed. Check your API token (cl config init).[/red]")
-            sys.exit(1)
+            raise ClickUpAPIError("Authentication failed. Check your API token (cl config init).", 401)
         if response.status_code == 404:
-            console.print(f"[red]Resource not found: {path}[/red]")
-            sys.exit(1)
+            raise ClickUpAPIError(f"Resource not found: {path}", 404)
         if response.status_code == 429:
-            console.print("[red]Rate limited by ClickUp API. Wait a moment and try again.[/red]")
-            sys.exit(1)
+            raise ClickUpAPIError("Rate limited by ClickUp API. Wait a moment and try again.", 429)
         if response.status_code >= 400:
-            console.print(f"[red]API error ({response.status_code}): {response.text}[/red]")
-            sys.exit(1)
+            raise ClickUpAPIError(f"API error ({response.status_code}): {response.text}", response.status_code)
 
         return response.json()
 
+    def _request(self, method: str, path: str, raise_errors: bool = False, **kwargs) -> dict:
+        """Send a request, printing the error and exiting if it fails.
+
+        With ``raise_errors`` the ClickUpAPIError is raised to the caller
+        instead, for callers that handle failures themselves.
+        """
+        if raise_errors:
+            return self._send(method, path, **kwargs)
+        try:
+            return self._send(method, path, **kwargs)
+        except ClickUpAPIError as e:
+            console.print(f"[red]{e}[/red]")
+            sys.exit(1)
+
     def get_user(self) -> dict:
         data = self._request("GET", "/user")
         return data.get("user", {})
@@ -50,8 +115,8 @@ class ClickUpClient:
         data = self._request("GET", "/team")
         return data.get("teams", [])
 
-    def list_spaces(self, team_id: str) -> list[Space]:
-        data = self._request("GET", f"/team/{team_id}/space")
+    def list_spaces(self, team_id: str, raise_errors: bool = False) -> list[Space]:
+        data = self._request("GET", f"/team/{team_id}/space", raise_errors=raise_errors)
         return [Space.from_api(s) for s in data.get("spaces", [])]
 
     def list_folders(self, space_id: str) -> list[Folder]:
@@ -66,7 +131,8 @@ class ClickUpClient:
         data = self._request("GET", f"/space/{space_id}/list")
         return [TaskList.from_api(l) for l in data.get("lists", [])]
 
-    def list_tasks(self, list_id: str, **filters) -> list[Task]:
+    @staticmethod
+    def _task_params(filters: dict) -> dict:
         params = {}
         if "statuses" in filters:
             params["statuses[]"] = filters["statuses"]
@@ -74,14 +140,36 @@ class ClickUpClient:
             params["assignees[]"] = filters["assignees"]
         if filters.get("reverse"):
             params["reverse"] = "true"
+        if filters.get("include_closed"):
+            params["include_closed"] = "true"
+        if filters.get("subtasks"):
+            params["subtasks"] = "true"
+        return params
+
+    def list_tasks(self, list_id: str, **filters) -> list[Task]:
+        params = self._task_params(filters)
         data = self._request("GET", f"/list/{list_id}/task", params=params)
         return [Task.from_api(t) for t in data.get("tasks", [])]
 
-    def get_task(self, task_id: str) -> Task:
-        data = self._request("GET", f"/task/{task_id}")
+    def iter_task_pages(self, list_id: str, start_page: int = 0, **filters) -> Iterator[tuple[int, list[Task], bool]]:
+        """Yield ``(page, tasks, is_last)`` for every matching task in a list."""
+        page = start_page
+        while True:
+            params = {**self._task_params(filters), "page": page}
+            data = self._request("GET", f"/list/{list_id}/task", params=params)
+            tasks = [Task.from_api(t) for t in data.get("tasks", [])]
+            last = data.get("last_page", True) or not tasks
+            yield page, tasks, last
+            if last:
+                return
+            page += 1
+
+    def get_task(self, task_id: str, include_subtasks: bool = False, raise_errors: bool = False) -> Task:
+        params = {"include_subtasks": "true"} if include_subtasks else {}
+        data = self._request("GET", f"/task/{task_id}", raise_errors=raise_errors, params=params)
         return Task.from_api(data)
 
-    def get_workspace_tasks(self, team_id: str, assignee_id: str) -> list[Task]:
+    def get_workspace_tasks(self, team_id: str, assignee_id: str, raise_errors: bool = False) -> list[Task]:
         try:
             assignee_int = int(assignee_id)
         except ValueError:
@@ -89,16 +177,23 @@ class ClickUpClient:
             sys.exit(1)
         # include_closed=false is intentional: this command only shows open tasks
         params = {"assignees[]": [assignee_int], "include_closed": "false"}
-        data = self._request("GET", f"/team/{team_id}/task", params=params)
+        data = self._request("GET", f"/team/{team_id}/task", raise_errors=raise_errors, params=params)
         return [Task.from_api(t) for t in data.get("tasks", [])]
 
-    def create_task(self, list_id: str, task_data: dict) -> Task:
-        data = self._request("POST", f"/list/{list_id}/task", json=task_data)
+    def create_task(self, list_id: str, task_data: dict, raise_errors: bool = False) -> Task:
+        data = self._request("POST", f"/list/{list_id}/task", raise_errors=raise_errors, json=task_data)
         return Task.from_api(data)
 
-    def update_task(self, task_id: str, task_data: dict) -> Task:
-        data = self._request("PUT", f"/task/{task_id}", json=task_data)
+    def update_task(self, task_id: str, task_data: dict, raise_errors: bool = False) -> Task:
+        data = self._request("PUT", f"/task/{task_id}", raise_errors=raise_errors, json=task_data)
         return Task.from_api(data)
 
+    def add_tag(self, task_id: str, tag_name: str) -> None:
+        # Tag names may contain '/', '#', '?' etc., which must not end the path segment.
+        self._request("POST", f"/task/{task_id}/tag/{quote(tag_name, safe='')}")
+
+    def remove_tag(self, task_id: str, tag_name: str) -> None:
+        self._request("DELETE", f"/task/{task_id}/tag/{quote(tag_name, safe='')}")
+
     def delete_task(self, task_id: str) -> None:
         self._request("DELETE", f"/task/{task_id}")
@@ -0,0 +1,58 @@
+import click
+from rich.console import Console
+from rich.table import Table
+
+from clickup_cli.apply import apply_change, load_spec, plan
+from clickup_cli.helpers import get_client
+
+console = Console()
+
+
+def _print_plan(changes) -> None:
+    table = Table(title="Plan")
+    table.add_column("Task", style="bold")
+    table.add_column("Field")
+    table.add_column("Current", style="red")
+    table.add_column("Desired", style="green")
+    for change in changes:
+        for i, (name, old, new) in enumerate(change.diffs):
+            label = f"{change.name} ({change.task_id})" if i == 0 else ""
+            table.add_row(label, name, old, new)
+    console.print(table)
+
+
+@click.command("apply")
+@click.argument("spec_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--dry-run", is_flag=True, help="Show the changes without sending them.")
+def apply_cmd(spec_file, dry_run):
+    """Bring tasks in line with a YAML spec, sending only what changed."""
+    try:
+        entries = load_spec(spec_file)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1)
+    client = get_client()
+
+    with console.status(f"Fetching {len(entries)} task(s)..."):
+        try:
+            changes = plan(client, entries)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise SystemExit(1)
+
+    pending = [c for c in changes if c.diffs]
+    unchanged = len(changes) - len(pending)
+    if not pending:
+        console.print(f"[green]All {unchanged} task(s) are up to date.[/green]")
+        return
+
+    _print_plan(pending)
+    requests = sum(c.requests for c in pending)
+    summary = f"{len(pending)} to change, {unchanged} unchanged, {requests} request(s)"
+    if dry_run:
+        console.print(f"[yellow]Dry run: {summary}.[/yellow]")
+        return
+
+    for change in pending:
+        apply_change(client, change)
+    console.print(f"[green]Applied: {summary}.[/green]")
@@ -2,7 +2,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from clickup_cli.config import CONFIG_FILE, load_config, save_config
+from clickup_cli.config import CONFIG_FILE, load_config, read_config, save_config
 
 console = Console()
 
@@ -13,8 +13,13 @@ def config_group():
     pass
 
 
+def _mask_token(token: str) -> str:
+    return token[:8] + "..." if len(token) > 8 else "***"
+
+
 @config_group.command("init")
-def config_init():
+@click.option("--profile", default=None, help="Save as a named profile instead of the default settings.")
+def config_init(profile):
     """Set up ClickUp CLI configuration."""
     api_token = click.prompt("Enter your ClickUp API token", hide_input=True)
 
@@ -42,13 +47,18 @@ def config_init():
         choice = click.prompt("Select workspace", type=int, default=1)
         workspace = teams[choice - 1]
 
-    config = {
+    settings = {
         "api_token": api_token,
         "user_id": user["id"],
         "username": user.get("username", user.get("email", "")),
         "workspace_id": workspace["id"],
         "workspace_name": workspace["name"],
     }
+    config = read_config()
+    if profile:
+        config.setdefault("profiles", {})[profile] = settings
+    else:
+        config.update(settings)
     save_config(config)
     console.print(f"[green]Config saved to {CONFIG_FILE}[/green]")
 
@@ -69,7 +79,12 @@ def config_show():
     for key, value in config.items():
         display_value = value
         if key == "api_token":
-            display_value = value[:8] + "..." if len(value) > 8 else "***"
+            display_value = _mask_token(value)
+        elif key == "profiles":
+            display_value = ", ".join(
+                f"{name} ({p.get('workspace_name', p.get('workspace_id', '?'))}, {_mask_token(p.get('api_token', ''))})"
+                for name, p in value.items()
+            )
         table.add_row(key, str(display_value))
 
     console.print(table)
@@ -0,0 +1,60 @@
+import sqlite3
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from clickup_cli.export import FORMATS, default_format, iter_lists, open_writer
+from clickup_cli.helpers import get_client, get_workspace_id, resolve_alias
+
+console = Console()
+
+
+@click.command("export")
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option("-s", "--space-id", default=None, help="Space ID to export (default: whole workspace).")
+@click.option("-F", "--format", "fmt", type=click.Choice(FORMATS), default=None, help="Output format (default: from file extension).")
+def export_cmd(output, space_id, fmt):
+    """Export every task in a space or workspace to a columnar file.
+
+    Re-running an interrupted export with the same arguments resumes it;
+    with different arguments it starts over.
+    """
+    if space_id:
+        space_id = resolve_alias(space_id, "space")
+    fmt = fmt or default_format(output)
+    client = get_client()
+
+    if space_id:
+        space_ids = [space_id]
+    else:
+        space_ids = [s.id for s in client.list_spaces(get_workspace_id())]
+
+    try:
+        writer = open_writer(output, fmt, space_ids)
+    except RuntimeError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1)
+    except sqlite3.DatabaseError as e:
+        console.print(f"[red]Cannot export to {output}: {e}.[/red]")
+        raise SystemExit(1)
+    if writer.resumed:
+        console.print(f"[yellow]Resuming unfinished export to {output}.[/yellow]")
+    elif writer.discarded:
+        console.print(f"[yellow]Discarding unfinished export to {output} made with different arguments.[/yellow]")
+
+    total = 0
+    with console.status("Exporting tasks...") as status:
+        for task_list in iter_lists(client, space_ids):
+            start = writer.resume_point(task_list.id)
+            if start is None:
+                continue
+            for page, tasks, last in client.iter_task_pages(
+                task_list.id, start_page=start, include_closed=True, subtasks=True
+            ):
+                writer.write_page(task_list.id, page, tasks, last)
+                total += len(tasks)
+                status.update(f"Exporting tasks... {task_list.name} (page {page + 1}, {total} tasks)")
+        writer.finish()
+
+    console.print(f"[green]Exported {total} tasks to {output} ({fmt}).[/green]")
@@ -0,0 +1,107 @@
+import subprocess
+import sys
+from datetime import datetime
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from clickup_cli.write_queue import CONFLICT, clear_queue, drop_entry, flush_queue, list_entries
+
+console = Console()
+
+
+def spawn_background_flush(profile: str | None = None) -> None:
+    """Start a detached `cl queue flush` so the current command can return."""
+    profile_args = ["--profile", profile] if profile else []
+    subprocess.Popen(
+        [sys.executable, "-m", "clickup_cli", *profile_args, "queue", "flush", "--quiet"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+@click.group("queue")
+def queue_group():
+    """Manage task changes queued for later delivery."""
+    pass
+
+
+@queue_group.command("list")
+def queue_list():
+    """Show queued task changes."""
+    entries = list_entries()
+    if not entries:
+        console.print("[yellow]Queue is empty.[/yellow]")
+        return
+    table = Table(title="Queued Changes")
+    table.add_column("ID", style="dim")
+    table.add_column("Op")
+    table.add_column("Profile")
+    table.add_column("Target")
+    table.add_column("Fields")
+    table.add_column("Status")
+    table.add_column("Queued")
+    table.add_column("Error", style="red")
+    for e in entries:
+        target = f"task {e['task_id']}" if e["op"] == "update" else f"list {e['list_id']}"
+        status = f"[red]{e['status']}[/red]" if e["status"] == CONFLICT else e["status"]
+        table.add_row(
+            e["id"],
+            e["op"],
+            e.get("profile") or "default",
+            target,
+            ", ".join(e["data"]) or "-",
+            status,
+            datetime.fromtimestamp(e["queued_at"]).strftime("%m-%d %H:%M"),
+            e["error"] or "",
+        )
+    console.print(table)
+
+
+@queue_group.command("flush")
+@click.option("--retry-conflicts", is_flag=True, help="Resend entries previously rejected by the API.")
+@click.option("--quiet", is_flag=True, hidden=True)
+def queue_flush(retry_conflicts, quiet):
+    """Send queued task changes to ClickUp.
+
+    Each change is sent with the profile it was queued under.
+    """
+    # The background flush waits its turn rather than leaving its entry behind.
+    result = flush_queue(retry_conflicts=retry_conflicts, wait=quiet)
+    if quiet:
+        return
+    if result.busy:
+        console.print("[yellow]Another flush is already running.[/yellow]")
+        return
+    for e in result.sent:
+        target = e.get("task_id") or e["data"].get("name", "")
+        console.print(f"[green]Sent {e['op']} {target} ({e['id']})[/green]")
+    for e in result.conflicts:
+        console.print(f"[red]Conflict on {e['op']} {e.get('task_id', e.get('list_id'))} ({e['id']}): {e['error']}[/red]")
+    for e in result.deferred:
+        console.print(f"[yellow]Deferred {e['op']} ({e['id']}): {e['error']}[/yellow]")
+    if not (result.sent or result.conflicts or result.deferred):
+        console.print("[yellow]Nothing to flush.[/yellow]")
+    if result.conflicts:
+        raise SystemExit(1)
+
+
+@queue_group.command("drop")
+@click.argument("entry_id")
+def queue_drop(entry_id):
+    """Remove a queued change without sending it."""
+    if not drop_entry(entry_id):
+        console.print(f"[red]Queue entry '{entry_id}' not found.[/red]")
+        raise SystemExit(1)
+    console.print(f"[green]Queue entry {entry_id} dropped.[/green]")
+
+
+@queue_group.command("clear")
+@click.confirmation_option(prompt="Discard all queued changes?")
+def queue_clear():
+    """Discard all queued changes."""
+    count = clear_queue()
+    console.print(f"[green]Discarded {count} queued change(s).[/green]")
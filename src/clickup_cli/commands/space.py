@@ -1,6 +1,7 @@
 import click
 
-from clickup_cli.helpers import get_client, get_workspace_id
+from clickup_cli.fanout import fan_out
+from clickup_cli.helpers import get_client, get_workspace_id, get_workspace_profiles
 from clickup_cli.formatting import print_spaces
 
 
@@ -11,8 +12,19 @@ def space_group():
 
 
 @space_group.command("list")
-def space_list():
+@click.option("-A", "--all-workspaces", is_flag=True, help="List spaces from every configured workspace.")
+def space_list(all_workspaces):
     """List all spaces in the workspace."""
+    if all_workspaces:
+        spaces, workspaces = [], []
+        results = fan_out(
+            get_workspace_profiles(), lambda c, p: c.list_spaces(p["workspace_id"], raise_errors=True)
+        )
+        for profile, found in results:
+            spaces += found
+            workspaces += [profile["workspace_name"] or profile["workspace_id"]] * len(found)
+        print_spaces(spaces, workspaces)
+        return
     client = get_client()
     workspace_id = get_workspace_id()
     spaces = client.list_spaces(workspace_id)
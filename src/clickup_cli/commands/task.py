@@ -1,24 +1,25 @@
 import click
 from rich.console import Console
 
-from clickup_cli.helpers import get_client, get_user_id, get_workspace_id, resolve_alias
-from clickup_cli.formatting import print_task_detail, print_tasks
+from clickup_cli.commands.queue_cmd import spawn_background_flush
+from clickup_cli.fanout import fan_out
+from clickup_cli.helpers import (
+    get_client,
+    get_profile,
+    get_user_id,
+    get_workspace_id,
+    get_workspace_profiles,
+    parse_due_date,
+    parse_time_estimate,
+    resolve_alias,
+)
+from clickup_cli.formatting import _format_time_estimate, print_task_detail, print_tasks
+from clickup_cli.graph import build_graph, critical_path, render_dot, render_json, render_tree, total_estimate
+from clickup_cli.write_queue import enqueue_create, enqueue_update
 
 console = Console()
 
 
-def _parse_time_estimate(value: str) -> int:
-    """Parse a time string (e.g. '2h', '30m', '1h30m') to milliseconds."""
-    import re
-    match = re.fullmatch(r"(?:(\d+)h)?(?:(\d+)m)?", value)
-    if not match or not any(match.groups()):
-        console.print(f"[red]Invalid time estimate '{value}'. Use format like '2h', '30m', or '1h30m'.[/red]")
-        raise SystemExit(1)
-    hours = int(match.group(1) or 0)
-    minutes = int(match.group(2) or 0)
-    return (hours * 3600 + minutes * 60) * 1000
-
-
 @click.group("task")
 def task_group():
     """Manage ClickUp tasks!"""
@@ -29,7 +30,8 @@ def task_group():
 @click.option("-l", "--list-id", required=True, help="List ID to show tasks from.")
 @click.option("-s", "--status", default=None, help="Filter by status.")
 @click.option("-a", "--assignee", default=None, help="Filter by assignee.")
-def task_list(list_id, status, assignee):
+@click.option("-P", "--pager", is_flag=True, help="Browse all pages in a scrollable, searchable view.")
+def task_list(list_id, status, assignee, pager):
     """List tasks in a ClickUp list."""
     list_id = resolve_alias(list_id, "list")
     client = get_client()
@@ -38,6 +40,11 @@ def task_list(list_id, status, assignee):
         filters["statuses"] = [status]
     if assignee:
         filters["assignees"] = [assignee]
+    if pager:
+        from clickup_cli.pager import page_tasks
+
+        page_tasks(tasks for _, tasks, _ in client.iter_task_pages(list_id, **filters))
+        return
     tasks = client.list_tasks(list_id, **filters)
     print_tasks(tasks)
 
@@ -45,15 +52,29 @@ def task_list(list_id, status, assignee):
 @task_group.command("view")
 @click.argument("task_id", required=False, default=None)
 @click.option("-u", "--user", "user_id", default=None, help="User ID to filter by (default: current user).")
-def task_view(task_id, user_id):
+@click.option("-A", "--all-workspaces", is_flag=True, help="List open tasks from every configured workspace.")
+def task_view(task_id, user_id, all_workspaces):
     """View a task by ID, or list open tasks assigned to a user."""
-    client = get_client()
     if task_id:
         if user_id is not None:
             console.print("[yellow]Warning: --user is ignored when a task_id is provided.[/yellow]")
+        if all_workspaces:
+            console.print("[yellow]Warning: --all-workspaces is ignored when a task_id is provided.[/yellow]")
+        client = get_client()
         task = client.get_task(task_id)
         print_task_detail(task)
+    elif all_workspaces:
+        tasks, workspaces = [], []
+        results = fan_out(
+            get_workspace_profiles(),
+            lambda c, p: c.get_workspace_tasks(p["workspace_id"], user_id or str(p["user_id"]), raise_errors=True),
+        )
+        for profile, found in results:
+            tasks += found
+            workspaces += [profile["workspace_name"] or profile["workspace_id"]] * len(found)
+        print_tasks(tasks, workspaces)
     else:
+        client = get_client()
         if user_id is None:
             user_id = get_user_id()
         workspace_id = get_workspace_id()
@@ -61,6 +82,39 @@ def task_view(task_id, user_id):
         print_tasks(tasks)
 
 
+@task_group.command("graph")
+@click.argument("task_id")
+@click.option("-f", "--format", "fmt", type=click.Choice(["tree", "dot", "json"]), default="tree", help="Output format.")
+@click.option("--max-depth", type=int, default=3, show_default=True, help="Levels of links to follow from the task.")
+@click.option("--max-fanout", type=int, default=25, show_default=True, help="Links followed per task.")
+@click.option("--max-nodes", type=int, default=200, show_default=True, help="Total tasks fetched.")
+def task_graph(task_id, fmt, max_depth, max_fanout, max_nodes):
+    """Show subtasks, parents and dependencies around a task."""
+    client = get_client()
+    with console.status("Fetching task graph..."):
+        graph = build_graph(client, task_id, max_depth=max_depth, max_fanout=max_fanout, max_nodes=max_nodes)
+    if task_id in graph.unfetched:
+        console.print(f"[red]{graph.unfetched[task_id]}[/red]")
+        raise SystemExit(1)
+
+    if fmt == "dot":
+        click.echo(render_dot(graph))
+        return
+    if fmt == "json":
+        click.echo(render_json(graph))
+        return
+
+    console.print(render_tree(graph))
+    length, path = critical_path(graph)
+    console.print(f"\n  Tasks:         {len(graph.nodes)}")
+    console.print(f"  Total estimate: {_format_time_estimate(total_estimate(graph))}")
+    console.print(f"  Critical path:  {_format_time_estimate(length)}  ({' → '.join(path)})")
+    if graph.unfetched:
+        console.print(f"[yellow]  {len(graph.unfetched)} linked task(s) could not be fetched and are left out of the totals.[/yellow]")
+    if graph.truncated:
+        console.print(f"[yellow]  Limits reached at {len(graph.truncated)} task(s); raise --max-depth/--max-fanout/--max-nodes to see more.[/yellow]")
+
+
 @task_group.command("create")
 @click.option("-l", "--list-id", required=True, help="List ID to create the task in.")
 @click.option("-n", "--name", required=True, help="Task name.")
@@ -71,10 +125,10 @@ def task_view(task_id, user_id):
 @click.option("-D", "--due-date", default=None, help="Due date (YYYY-MM-DD).")
 @click.option("-t", "--tag", multiple=True, help="Tag(s) to add.")
 @click.option("-T", "--time-estimate", default=None, help="Time estimate (e.g. 2h, 30m, 1h30m).")
-def task_create(list_id, name, description, status, priority, assignee, due_date, tag, time_estimate):
+@click.option("-q", "--queue", "queued", is_flag=True, help="Queue the change locally and send it in the background.")
+def task_create(list_id, name, description, status, priority, assignee, due_date, tag, time_estimate, queued):
     """Create a new task."""
     list_id = resolve_alias(list_id, "list")
-    client = get_client()
     task_data = {"name": name}
     if description:
         task_data["description"] = description
@@ -85,15 +139,19 @@ def task_create(list_id, name, description, status, priority, assignee, due_date
     if assignee:
         task_data["assignees"] = [int(assignee)]
     if due_date:
-        from datetime import datetime
-
-        dt = datetime.strptime(due_date, "%Y-%m-%d")
-        task_data["due_date"] = int(dt.timestamp() * 1000)
+        task_data["due_date"] = parse_due_date(due_date)
     if tag:
         task_data["tags"] = list(tag)
     if time_estimate:
-        task_data["time_estimate"] = _parse_time_estimate(time_estimate)
+        task_data["time_estimate"] = parse_time_estimate(time_estimate)
+
+    if queued:
+        entry = enqueue_create(list_id, task_data, get_profile())
+        spawn_background_flush(get_profile())
+        console.print(f"[green]Task creation queued: {name} ({entry['id']})[/green]")
+        return
 
+    client = get_client()
     task = client.create_task(list_id, task_data)
     console.print(f"[green]Task created: {task.name} ({task.id})[/green]")
 
@@ -109,9 +167,9 @@ def task_create(list_id, name, description, status, priority, assignee, due_date
 @click.option("-D", "--due-date", default=None, help="Due date (YYYY-MM-DD).")
 @click.option("-t", "--tag", multiple=True, help="Tag(s) to set.")
 @click.option("-T", "--time-estimate", default=None, help="Time estimate (e.g. 2h, 30m, 1h30m).")
-def task_update(task_id, name, description, status, priority, assignee, remove_assignee, due_date, tag, time_estimate):
+@click.option("-q", "--queue", "queued", is_flag=True, help="Queue the change locally and send it in the background.")
+def task_update(task_id, name, description, status, priority, assignee, remove_assignee, due_date, tag, time_estimate, queued):
     """Update an existing task."""
-    client = get_client()
     task_data = {}
     if name:
         task_data["name"] = name
@@ -129,19 +187,23 @@ def task_update(task_id, name, description, status, priority, assignee, remove_a
     if assignees_payload:
         task_data["assignees"] = assignees_payload
     if due_date:
-        from datetime import datetime
-
-        dt = datetime.strptime(due_date, "%Y-%m-%d")
-        task_data["due_date"] = int(dt.timestamp() * 1000)
+        task_data["due_date"] = parse_due_date(due_date)
     if tag:
         task_data["tags"] = list(tag)
     if time_estimate:
-        task_data["time_estimate"] = _parse_time_estimate(time_estimate)
+        task_data["time_estimate"] = parse_time_estimate(time_estimate)
 
     if not task_data:
         console.print("[yellow]No updates specified.[/yellow]")
         return
 
+    if queued:
+        entry = enqueue_update(task_id, task_data, get_profile())
+        spawn_background_flush(get_profile())
+        console.print(f"[green]Task update queued: {task_id} ({entry['id']})[/green]")
+        return
+
+    client = get_client()
     task = client.update_task(task_id, task_data)
     console.print(f"[green]Task updated: {task.name} ({task.id})[/green]")
 
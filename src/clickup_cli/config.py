@@ -6,23 +6,73 @@ CONFIG_DIR = Path.home() / ".clickup-cli"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
 
-def load_config() -> dict:
-    """Load config from ~/.clickup-cli/config.yaml."""
+PROFILE_KEYS = ("api_token", "user_id", "username", "workspace_id", "workspace_name")
+
+
+def read_config() -> dict:
+    """Read the raw config file, or an empty config if there is none."""
+    if not CONFIG_FILE.exists():
+        return {}
+    with open(CONFIG_FILE) as f:
+        return yaml.safe_load(f) or {}
+
+
+def load_config(profile: str | None = None) -> dict:
+    """Load config from ~/.clickup-cli/config.yaml.
+
+    With ``profile``, that profile's token and workspace settings override
+    the top-level ones. A top-level ``api_token`` is only required when no
+    profiles are configured.
+    """
     if not CONFIG_FILE.exists():
         raise FileNotFoundError(
             f"Config not found at {CONFIG_FILE}. Run 'cl config init' to set up."
         )
-    with open(CONFIG_FILE) as f:
-        config = yaml.safe_load(f)
-    if not config or "api_token" not in config:
+    config = read_config()
+    if profile:
+        profiles = config.get("profiles", {})
+        if profile not in profiles:
+            raise ValueError(
+                f"Profile '{profile}' not found. Run 'cl config init --profile {profile}'."
+            )
+        config = {**config, **profiles[profile]}
+    if "api_token" not in config and not config.get("profiles"):
         raise ValueError(
             "Config is missing 'api_token'. Run 'cl config init' to fix."
         )
     return config
 
 
+def require_token(config: dict) -> str:
+    """The API token of a loaded config, which may only exist in profiles."""
+    if "api_token" not in config:
+        names = ", ".join(config.get("profiles", {}))
+        raise ValueError(
+            f"No default 'api_token' in config. Select a profile with --profile ({names})."
+        )
+    return config["api_token"]
+
+
+def workspace_profiles(config: dict) -> list[dict]:
+    """Every configured token/workspace pair, named, with duplicates removed.
+
+    The top-level settings are the ``default`` profile.
+    """
+    candidates = [("default", config)] + list(config.get("profiles", {}).items())
+    seen = set()
+    profiles = []
+    for name, values in candidates:
+        key = (values.get("api_token"), values.get("workspace_id"))
+        if not all(key) or key in seen:
+            continue
+        seen.add(key)
+        profiles.append({"name": name, **{k: values.get(k) for k in PROFILE_KEYS}})
+    return profiles
+
+
 def save_config(config: dict) -> None:
     """Save config to ~/.clickup-cli/config.yaml."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, "w") as f:
         yaml.dump(config, f, default_flow_style=False)
+
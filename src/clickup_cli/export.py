@@ -0,0 +1,320 @@
+"""Streaming task export to Parquet, Arrow IPC or SQLite.
+
+Tasks are fetched one API page at a time and written in row groups of at
+most ``ROW_GROUP_SIZE`` rows, so memory use is bounded by the row group size
+rather than the size of the workspace. An interrupted export can
+be resumed by running the same command again: SQLite exports continue from
+the last committed page, Parquet/Arrow exports from the last completed list.
+Progress left by an export with different spaces or format is discarded.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Iterator
+
+from clickup_cli.client import ClickUpClient
+from clickup_cli.models import Task, TaskList
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional dependency
+    pa = None
+
+FORMATS = ("parquet", "arrow", "sqlite")
+
+# Rows per Parquet row group / Arrow record batch. Large enough to compress
+# well, small enough that buffering one group stays cheap.
+ROW_GROUP_SIZE = 64 * 1024
+
+COLUMNS = [
+    "id",
+    "name",
+    "status",
+    "assignees",
+    "priority",
+    "due_date",
+    "time_estimate",
+    "tags",
+    "description",
+    "url",
+    "list_id",
+]
+
+
+def default_format(path: Path) -> str:
+    """Pick a format from the file extension, falling back on what is installed."""
+    suffix = path.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    if suffix in (".arrow", ".feather", ".ipc"):
+        return "arrow"
+    if suffix in (".db", ".sqlite", ".sqlite3"):
+        return "sqlite"
+    return "parquet" if pa is not None else "sqlite"
+
+
+def _due_date_ms(task: Task) -> int | None:
+    try:
+        return int(task.due_date) if task.due_date else None
+    except ValueError:
+        return None
+
+
+def export_params(space_ids: list[str], fmt: str) -> str:
+    """What an unfinished export must match to be resumed, as stored with its progress."""
+    return json.dumps({"format": fmt, "space_ids": sorted(space_ids)}, sort_keys=True)
+
+
+def iter_lists(client: ClickUpClient, space_ids: list[str]) -> Iterator[TaskList]:
+    for space_id in space_ids:
+        for folder in client.list_folders(space_id):
+            yield from client.list_lists(folder.id)
+        yield from client.list_folderless_lists(space_id)
+
+
+class SQLiteExportWriter:
+    """Writes tasks into a ``tasks`` table, committing progress with every page."""
+
+    def __init__(self, path: Path, params: str):
+        saved = self._saved_params(path) if path.exists() else None
+        fresh = saved != params
+        # Progress from an export with other arguments can't be resumed.
+        self.discarded = fresh and saved is not None
+        if fresh and path.exists():
+            path.unlink()
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                name TEXT,
+                status TEXT,
+                assignees TEXT,
+                priority TEXT,
+                due_date INTEGER,
+                time_estimate INTEGER,
+                tags TEXT,
+                description TEXT,
+                url TEXT,
+                list_id TEXT
+            );
+            CREATE TABLE IF NOT EXISTS export_progress (
+                list_id TEXT PRIMARY KEY,
+                next_page INTEGER,
+                done INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS export_params (
+                params TEXT
+            );
+            """
+        )
+        if fresh:
+            with self._conn:
+                self._conn.execute("INSERT INTO export_params (params) VALUES (?)", (params,))
+        self.resumed = not fresh
+
+    @staticmethod
+    def _saved_params(path: Path) -> str | None:
+        """Arguments of the unfinished export in ``path``, or None if it has none."""
+        conn = sqlite3.connect(path)
+        try:
+            has_progress = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'export_progress'"
+            ).fetchone()
+            if has_progress is None:
+                return None
+            try:
+                row = conn.execute("SELECT params FROM export_params").fetchone()
+            except sqlite3.OperationalError:
+                row = None
+        finally:
+            conn.close()
+        # An export without recorded arguments is never resumed.
+        return row[0] if row else ""
+
+    def resume_point(self, list_id: str) -> int | None:
+        """Page to start ``list_id`` from, or None if it is already exported."""
+        row = self._conn.execute(
+            "SELECT next_page, done FROM export_progress WHERE list_id = ?", (list_id,)
+        ).fetchone()
+        if row is None:
+            return 0
+        next_page, done = row
+        return None if done else next_page
+
+    def write_page(self, list_id: str, page: int, tasks: list[Task], last: bool) -> None:
+        rows = [
+            (
+                t.id,
+                t.name,
+                t.status,
+                json.dumps(t.assignees),
+                t.priority,
+                _due_date_ms(t),
+                t.time_estimate,
+                json.dumps(t.tags),
+                t.description,
+                t.url,
+                t.list_id or list_id,
+            )
+            for t in tasks
+        ]
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO tasks ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO export_progress (list_id, next_page, done) VALUES (?, ?, ?)",
+                (list_id, page + 1, int(last)),
+            )
+
+    def finish(self) -> None:
+        with self._conn:
+            self._conn.execute("DROP TABLE export_progress")
+            self._conn.execute("DROP TABLE export_params")
+        self._conn.execute("VACUUM")
+        self._conn.close()
+
+
+class _RowGroupBuffer:
+    """Collects small tables and writes them out in ``ROW_GROUP_SIZE`` row groups."""
+
+    def __init__(self, writer):
+        self._writer = writer
+        self._tables = []
+        self._rows = 0
+
+    def add(self, table) -> None:
+        if not table.num_rows:
+            return
+        self._tables.append(table)
+        self._rows += table.num_rows
+        while self._rows >= ROW_GROUP_SIZE:
+            combined = pa.concat_tables(self._tables)
+            self._write(combined.slice(0, ROW_GROUP_SIZE))
+            rest = combined.slice(ROW_GROUP_SIZE)
+            self._tables, self._rows = [rest], rest.num_rows
+
+    def flush(self) -> None:
+        if self._rows:
+            self._write(pa.concat_tables(self._tables))
+        self._tables, self._rows = [], 0
+
+    def _write(self, table) -> None:
+        # One chunk becomes one row group (Parquet) or record batch (Arrow).
+        self._writer.write_table(table.combine_chunks())
+
+
+class ArrowExportWriter:
+    """Buffers pages into row groups of a per-list part file.
+
+    Part files live in ``<output>.partial/`` and are only renamed into place
+    once their list is complete, so a resumed export skips finished lists and
+    restarts the interrupted one. The export's arguments are kept in
+    ``params.json`` next to the parts. ``finish`` concatenates the parts into the
+    output file, merging the last, partly filled row group of each part with
+    the next part's.
+    """
+
+    def __init__(self, path: Path, fmt: str, params: str):
+        if pa is None:
+            raise RuntimeError("pyarrow is required for Parquet/Arrow export. Install it or use --format sqlite.")
+        self._path = path
+        self._fmt = fmt
+        self._ext = "parquet" if fmt == "parquet" else "arrow"
+        self._parts = path.with_name(path.name + ".partial")
+        params_file = self._parts / "params.json"
+        saved = params_file.read_text() if params_file.exists() else None
+        self.resumed = saved == params
+        self.discarded = self._parts.exists() and not self.resumed
+        if self.discarded:
+            shutil.rmtree(self._parts)
+        if not self.resumed:
+            self._parts.mkdir(parents=True)
+            params_file.write_text(params)
+        self._writer = None
+        self._buffer = None
+        self._schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("name", pa.string()),
+                ("status", pa.string()),
+                ("assignees", pa.list_(pa.string())),
+                ("priority", pa.string()),
+                ("due_date", pa.timestamp("ms", tz="UTC")),
+                ("time_estimate", pa.int64()),
+                ("tags", pa.list_(pa.string())),
+                ("description", pa.string()),
+                ("url", pa.string()),
+                ("list_id", pa.string()),
+            ]
+        )
+
+    def _part(self, list_id: str) -> Path:
+        return self._parts / f"{list_id}.{self._ext}"
+
+    def _open(self, path: Path):
+        if self._fmt == "parquet":
+            return pq.ParquetWriter(path, self._schema, compression="zstd")
+        return pa_ipc.new_file(path, self._schema)
+
+    def resume_point(self, list_id: str) -> int | None:
+        return None if self._part(list_id).exists() else 0
+
+    def write_page(self, list_id: str, page: int, tasks: list[Task], last: bool) -> None:
+        tmp = self._part(list_id).with_suffix(".tmp")
+        if self._writer is None:
+            self._writer = self._open(tmp)
+            self._buffer = _RowGroupBuffer(self._writer)
+        batch = pa.RecordBatch.from_pydict(
+            {
+                "id": [t.id for t in tasks],
+                "name": [t.name for t in tasks],
+                "status": [t.status for t in tasks],
+                "assignees": [t.assignees for t in tasks],
+                "priority": [t.priority for t in tasks],
+                "due_date": [_due_date_ms(t) for t in tasks],
+                "time_estimate": [t.time_estimate for t in tasks],
+                "tags": [t.tags for t in tasks],
+                "description": [t.description for t in tasks],
+                "url": [t.url for t in tasks],
+                "list_id": [t.list_id or list_id for t in tasks],
+            },
+            schema=self._schema,
+        )
+        self._buffer.add(pa.Table.from_batches([batch]))
+        if last:
+            self._buffer.flush()
+            self._writer.close()
+            self._writer = self._buffer = None
+            tmp.rename(self._part(list_id))
+
+    def finish(self) -> None:
+        with self._open(self._path) as out:
+            buffer = _RowGroupBuffer(out)
+            for part in sorted(self._parts.glob(f"*.{self._ext}")):
+                if self._fmt == "parquet":
+                    reader = pq.ParquetFile(part)
+                    for i in range(reader.num_row_groups):
+                        buffer.add(reader.read_row_group(i))
+                else:
+                    with pa.memory_map(str(part)) as source:
+                        reader = pa_ipc.open_file(source)
+                        for i in range(reader.num_record_batches):
+                            buffer.add(pa.Table.from_batches([reader.get_batch(i)]))
+            buffer.flush()
+        shutil.rmtree(self._parts)
+
+
+def open_writer(path: Path, fmt: str, space_ids: list[str]) -> SQLiteExportWriter | ArrowExportWriter:
+    params = export_params(space_ids, fmt)
+    if fmt == "sqlite":
+        return SQLiteExportWriter(path, params)
+    return ArrowExportWriter(path, fmt, params)
@@ -0,0 +1,36 @@
+"""Run the same query against several workspaces concurrently."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, TypeVar
+
+from rich.console import Console
+
+from clickup_cli.client import ClickUpAPIError, ClickUpClient
+
+console = Console()
+
+T = TypeVar("T")
+
+
+def fan_out(profiles: list[dict], query: Callable[[ClickUpClient, dict], T]) -> Iterator[tuple[dict, T]]:
+    """Yield ``(profile, result)`` for each workspace, in profile order.
+
+    The queries run concurrently. Each profile gets its own client and
+    connection pool. Clients for the same API token draw from that token's
+    shared rate budget. ``query`` should make its requests with
+    ``raise_errors=True``; a workspace whose query fails is reported and
+    skipped.
+    """
+    clients = [(p, ClickUpClient(p["api_token"])) for p in profiles]
+    with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        futures = [(p, pool.submit(query, client, p)) for p, client in clients]
+        for profile, future in futures:
+            try:
+                result = future.result()
+            except ClickUpAPIError as e:
+                name = profile["workspace_name"] or profile["workspace_id"]
+                console.print(f"[yellow]Skipping workspace {name}: {e}[/yellow]")
+                continue
+            yield profile, result
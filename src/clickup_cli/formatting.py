@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from rich.console import Console
 from rich.table import Table
@@ -8,8 +9,13 @@ from clickup_cli.models import Folder, Space, Task, TaskList
 console = Console()
 
 
+@lru_cache(maxsize=4096)
 def _format_due_date(due_date: str | None) -> str:
-    """Convert Unix timestamp (ms) to local human-readable date."""
+    """Convert Unix timestamp (ms) to local human-readable date.
+
+    Cached because many tasks share a due date and the local timezone
+    lookup in ``astimezone`` dominates the cost on large tables.
+    """
     if not due_date:
         return "-"
     try:
@@ -40,13 +46,45 @@ PRIORITY_COLORS = {
     "low": "dim",
 }
 
-
-def print_spaces(spaces: list[Space]) -> None:
+PRIORITY_RANK = {"urgent": 1, "high": 2, "normal": 3, "low": 4}
+
+TASK_COLUMNS = [
+    ("ID", "dim"),
+    ("Name", "bold"),
+    ("Status", None),
+    ("Priority", None),
+    ("Assignees", None),
+    ("Due Date", None),
+    ("Estimate", None),
+    ("Tags", None),
+]
+
+
+def task_row(t: Task) -> tuple[str, ...]:
+    """Rendered cells for one task, in TASK_COLUMNS order."""
+    priority_style = PRIORITY_COLORS.get(t.priority or "", "")
+    return (
+        t.id,
+        t.name,
+        t.status,
+        f"[{priority_style}]{t.priority or '-'}[/{priority_style}]" if priority_style else (t.priority or "-"),
+        ", ".join(t.assignees) or "-",
+        _format_due_date(t.due_date),
+        _format_time_estimate(t.time_estimate),
+        ", ".join(t.tags) or "-",
+    )
+
+
+def print_spaces(spaces: list[Space], workspaces: list[str] | None = None) -> None:
+    """Print spaces; ``workspaces`` adds a per-row Workspace column."""
     table = Table(title="Spaces")
+    if workspaces is not None:
+        table.add_column("Workspace", style="cyan")
     table.add_column("ID", style="dim")
     table.add_column("Name", style="bold")
-    for s in spaces:
-        table.add_row(s.id, s.name)
+    for i, s in enumerate(spaces):
+        prefix = (workspaces[i],) if workspaces is not None else ()
+        table.add_row(*prefix, s.id, s.name)
     console.print(table)
 
 
@@ -68,29 +106,17 @@ def print_lists(lists: list[TaskList]) -> None:
     console.print(table)
 
 
-def print_tasks(tasks: list[Task]) -> None:
+def print_tasks(tasks: list[Task], workspaces: list[str] | None = None) -> None:
+    """Print tasks; ``workspaces`` adds a per-row Workspace column."""
     table = Table(title="Tasks")
-    table.add_column("ID", style="dim")
-    table.add_column("Name", style="bold")
-    table.add_column("Status")
-    table.add_column("Priority")
-    table.add_column("Assignees")
-    table.add_column("Due Date")
-    table.add_column("Estimate")
-    table.add_column("Tags")
-
-    for t in tasks:
-        priority_style = PRIORITY_COLORS.get(t.priority or "", "")
-        table.add_row(
-            t.id,
-            t.name,
-            t.status,
-            f"[{priority_style}]{t.priority or '-'}[/{priority_style}]" if priority_style else (t.priority or "-"),
-            ", ".join(t.assignees) or "-",
-            _format_due_date(t.due_date),
-            _format_time_estimate(t.time_estimate),
-            ", ".join(t.tags) or "-",
-        )
+    if workspaces is not None:
+        table.add_column("Workspace", style="cyan")
+    for name, style in TASK_COLUMNS:
+        table.add_column(name, style=style)
+
+    for i, t in enumerate(tasks):
+        prefix = (workspaces[i],) if workspaces is not None else ()
+        table.add_row(*prefix, *task_row(t))
 
     console.print(table)
 
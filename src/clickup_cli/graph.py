@@ -0,0 +1,205 @@
+"""Subtask/parent/dependency graph around a task."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from rich.tree import Tree
+
+from clickup_cli.client import ClickUpAPIError, ClickUpClient
+from clickup_cli.formatting import _format_time_estimate
+from clickup_cli.models import Task
+
+SUBTASK = "subtask"
+DEPENDS_ON = "depends_on"
+
+
+@dataclass
+class TaskGraph:
+    root: str
+    nodes: dict[str, Task] = field(default_factory=dict)
+    # (from_id, to_id, kind): parent -> subtask, or waiting task -> task it depends on.
+    edges: set[tuple[str, str, str]] = field(default_factory=set)
+    # Nodes whose neighbours were not followed because a limit was hit.
+    truncated: set[str] = field(default_factory=set)
+    # Linked tasks that could not be fetched (deleted, no access, ...), with the reason.
+    unfetched: dict[str, str] = field(default_factory=dict)
+
+    def children(self, task_id: str) -> list[str]:
+        return sorted(b for a, b, kind in self.edges if a == task_id and kind == SUBTASK and b in self.nodes)
+
+    def waits_on(self, task_id: str) -> list[str]:
+        return sorted(b for a, b, kind in self.edges if a == task_id and kind == DEPENDS_ON)
+
+
+def _neighbours(task: Task) -> list[str]:
+    ids = list(task.subtask_ids) + list(task.depends_on)
+    if task.parent:
+        ids.append(task.parent)
+    return ids
+
+
+def _fetch(client: ClickUpClient, task_id: str) -> tuple[str, Task | None, str | None]:
+    """Fetch one task, returning the API error instead of exiting."""
+    try:
+        return task_id, client.get_task(task_id, include_subtasks=True, raise_errors=True), None
+    except ClickUpAPIError as e:
+        return task_id, None, str(e)
+
+
+def build_graph(
+    client: ClickUpClient,
+    root_id: str,
+    max_depth: int = 3,
+    max_fanout: int = 25,
+    max_nodes: int = 200,
+    workers: int = 8,
+) -> TaskGraph:
+    """Breadth-first walk from ``root_id``, fetching each level concurrently.
+
+    Every task is fetched at most once. A node with more than ``max_fanout``
+    neighbours only has the first ``max_fanout`` followed; nothing beyond
+    ``max_depth`` levels or ``max_nodes`` tasks is fetched. Nodes cut short
+    by a limit are recorded in ``truncated``; tasks the API refuses are
+    recorded in ``unfetched`` and the walk continues without them.
+    """
+    graph = TaskGraph(root=root_id)
+    frontier = [root_id]
+    queued = {root_id}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for depth in range(max_depth + 1):
+            if not frontier:
+                break
+            results = pool.map(lambda tid: _fetch(client, tid), frontier)
+            next_frontier = []
+            for task_id, task, error in results:
+                if task is None:
+                    graph.unfetched[task_id] = error
+                    continue
+                graph.nodes[task.id] = task
+                for sub in task.subtask_ids:
+                    graph.edges.add((task.id, sub, SUBTASK))
+                if task.parent:
+                    graph.edges.add((task.parent, task.id, SUBTASK))
+                for dep in task.depends_on:
+                    graph.edges.add((task.id, dep, DEPENDS_ON))
+                for waiting in task.blocking:
+                    graph.edges.add((waiting, task.id, DEPENDS_ON))
+
+                neighbours = [n for n in _neighbours(task) if n not in queued]
+                if depth == max_depth:
+                    if neighbours:
+                        graph.truncated.add(task.id)
+                    continue
+                if len(neighbours) > max_fanout:
+                    graph.truncated.add(task.id)
+                    neighbours = neighbours[:max_fanout]
+                room = max_nodes - len(queued)
+                if len(neighbours) > room:
+                    graph.truncated.add(task.id)
+                    neighbours = neighbours[:max(room, 0)]
+                queued.update(neighbours)
+                next_frontier += neighbours
+            frontier = next_frontier
+    return graph
+
+
+def critical_path(graph: TaskGraph) -> tuple[int, list[str]]:
+    """Longest chain of ``time_estimate`` that must finish before the root.
+
+    A task can only finish after its subtasks and the tasks it depends on.
+    Unfetched tasks count as zero; dependency cycles are broken arbitrarily.
+    """
+    memo: dict[str, tuple[int, list[str]]] = {}
+    visiting: set[str] = set()
+
+    def finish(task_id: str) -> tuple[int, list[str]]:
+        if task_id in memo:
+            return memo[task_id]
+        task = graph.nodes.get(task_id)
+        if task is None or task_id in visiting:
+            return 0, []
+        visiting.add(task_id)
+        before = [finish(t) for t in graph.children(task_id) + graph.waits_on(task_id)]
+        visiting.discard(task_id)
+        longest, path = max(before, default=(0, []), key=lambda r: r[0])
+        memo[task_id] = (longest + (task.time_estimate or 0), path + [task_id])
+        return memo[task_id]
+
+    return finish(graph.root)
+
+
+def total_estimate(graph: TaskGraph, task_id: str | None = None) -> int:
+    """Sum of ``time_estimate`` over a task and all of its fetched subtasks."""
+    task_id = task_id or graph.root
+    task = graph.nodes.get(task_id)
+    own = (task.time_estimate or 0) if task else 0
+    return own + sum(total_estimate(graph, c) for c in graph.children(task_id))
+
+
+def _label(task: Task) -> str:
+    return f"{task.name} ({task.id})"
+
+
+def render_tree(graph: TaskGraph) -> Tree:
+    """Tree from the root's highest fetched ancestor down through subtasks."""
+    top = graph.root
+    seen = {top}
+    while (parent := graph.nodes[top].parent) in graph.nodes and parent not in seen:
+        top = parent
+        seen.add(top)
+
+    def add(branch: Tree, task_id: str, seen: set[str]) -> None:
+        task = graph.nodes[task_id]
+        label = f"[bold]{_label(task)}[/bold]" if task_id == graph.root else _label(task)
+        label += f"  [dim]{task.status} · {_format_time_estimate(task.time_estimate)}[/dim]"
+        if task_id in graph.truncated:
+            label += "  [yellow](truncated)[/yellow]"
+        node = branch.add(label)
+        for dep in graph.waits_on(task_id):
+            dep_task = graph.nodes.get(dep)
+            unavailable = "  [red](unavailable)[/red]" if dep in graph.unfetched else ""
+            node.add(f"[magenta]waits on[/magenta] {_label(dep_task) if dep_task else dep}{unavailable}")
+        for child in graph.children(task_id):
+            if child not in seen:
+                add(node, child, seen | {child})
+        for child in task.subtask_ids:
+            if child in graph.unfetched:
+                node.add(f"{child}  [red](unavailable)[/red]")
+
+    tree = Tree("Task graph", hide_root=True)
+    add(tree, top, {top})
+    return tree
+
+
+def render_dot(graph: TaskGraph) -> str:
+    lines = ["digraph tasks {", "  rankdir=LR;"]
+    for task in graph.nodes.values():
+        label = f"{task.name}\\n{_format_time_estimate(task.time_estimate)}".replace('"', '\\"')
+        style = ", style=bold" if task.id == graph.root else ""
+        lines.append(f'  "{task.id}" [label="{label}"{style}];')
+    for task_id in graph.unfetched:
+        lines.append(f'  "{task_id}" [label="{task_id}\\n(unavailable)", style=dotted];')
+    for a, b, kind in sorted(graph.edges):
+        style = "" if kind == SUBTASK else ' [style=dashed, label="waits on"]'
+        lines.append(f'  "{a}" -> "{b}"{style};')
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def render_json(graph: TaskGraph) -> str:
+    length, path = critical_path(graph)
+    return json.dumps(
+        {
+            "root": graph.root,
+            "nodes": [asdict(t) for t in graph.nodes.values()],
+            "edges": [{"from": a, "to": b, "type": kind} for a, b, kind in sorted(graph.edges)],
+            "truncated": sorted(graph.truncated),
+            "unfetched": graph.unfetched,
+            "total_estimate": total_estimate(graph),
+            "critical_path": {"time_estimate": length, "tasks": path},
+        },
+        indent=2,
+    )
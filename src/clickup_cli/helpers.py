@@ -1,25 +1,38 @@
+import re
+from datetime import datetime
+
+import click
 from rich.console import Console
 
 from clickup_cli.client import ClickUpClient
-from clickup_cli.config import load_config
+from clickup_cli.config import load_config, read_config, require_token, workspace_profiles
 
 console = Console()
 
 
+def get_profile() -> str | None:
+    """Profile selected with the global --profile option, if any."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return None
+    return (ctx.find_root().obj or {}).get("profile")
+
+
 def get_client() -> ClickUpClient:
     """Load config and return an authenticated ClickUp client."""
     try:
-        config = load_config()
+        config = load_config(get_profile())
+        api_token = require_token(config)
     except (FileNotFoundError, ValueError) as e:
         console.print(f"[red]{e}[/red]")
         raise SystemExit(1)
-    return ClickUpClient(config["api_token"])
+    return ClickUpClient(api_token)
 
 
 def get_workspace_id() -> str:
     """Load workspace_id from config."""
     try:
-        config = load_config()
+        config = load_config(get_profile())
     except (FileNotFoundError, ValueError) as e:
         console.print(f"[red]{e}[/red]")
         raise SystemExit(1)
@@ -30,6 +43,15 @@ def get_workspace_id() -> str:
     return wid
 
 
+def get_workspace_profiles() -> list[dict]:
+    """Load every configured token/workspace profile."""
+    profiles = workspace_profiles(read_config())
+    if not profiles:
+        console.print("[red]No workspaces configured. Run 'cl config init'.[/red]")
+        raise SystemExit(1)
+    return profiles
+
+
 def resolve_alias(value: str, expected_type: str | None = None) -> str:
     """Resolve @alias to ID. Pass through raw IDs unchanged."""
     if not value.startswith("@"):
@@ -51,7 +73,7 @@ def resolve_alias(value: str, expected_type: str | None = None) -> str:
 def get_user_id() -> str:
     """Load user_id from config."""
     try:
-        config = load_config()
+        config = load_config(get_profile())
     except (FileNotFoundError, ValueError) as e:
         console.print(f"[red]{e}[/red]")
         raise SystemExit(1)
@@ -60,3 +82,24 @@ def get_user_id() -> str:
         console.print("[red]No user_id in config. Run 'cl config init'.[/red]")
         raise SystemExit(1)
     return str(uid)
+
+
+def parse_time_estimate(value: str) -> int:
+    """Parse a time string (e.g. '2h', '30m', '1h30m') to milliseconds."""
+    match = re.fullmatch(r"(?:(\d+)h)?(?:(\d+)m)?", value)
+    if not match or not any(match.groups()):
+        console.print(f"[red]Invalid time estimate '{value}'. Use format like '2h', '30m', or '1h30m'.[/red]")
+        raise SystemExit(1)
+    hours = int(match.group(1) or 0)
+    minutes = int(match.group(2) or 0)
+    return (hours * 3600 + minutes * 60) * 1000
+
+
+def parse_due_date(value: str) -> int:
+    """Parse a YYYY-MM-DD date to a Unix timestamp (ms) at local midnight."""
+    try:
+        dt = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        console.print(f"[red]Invalid due date '{value}'. Use format YYYY-MM-DD.[/red]")
+        raise SystemExit(1)
+    return int(dt.timestamp() * 1000)
@@ -0,0 +1,73 @@
+"""Cross-process file locks used by the write queue and the rate limiter."""
+
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def _try_lock(f) -> bool:
+    if sys.platform == "win32":
+        import msvcrt
+
+        f.seek(0)
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    import fcntl
+
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _lock(f) -> None:
+    if sys.platform == "win32":
+        # msvcrt has no indefinitely blocking mode, so poll.
+        while not _try_lock(f):
+            time.sleep(0.05)
+        return
+
+    import fcntl
+
+    fcntl.flock(f, fcntl.LOCK_EX)
+
+
+def _unlock(f) -> None:
+    if sys.platform == "win32":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+
+    import fcntl
+
+    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path: Path, blocking: bool = True):
+    """Hold an exclusive lock on ``path`` for the duration of the block.
+
+    With ``blocking=False`` the block receives ``False`` instead of waiting
+    when another process already holds the lock.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+") as f:
+        if blocking:
+            _lock(f)
+        elif not _try_lock(f):
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            _unlock(f)
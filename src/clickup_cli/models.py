@@ -49,6 +49,7 @@ class Task:
     name: str
     status: str
     assignees: list[str] = field(default_factory=list)
+    assignee_ids: list[int] = field(default_factory=list)
     priority: str | None = None
     due_date: str | None = None
     time_estimate: int | None = None
@@ -56,14 +57,20 @@ class Task:
     description: str = ""
     url: str = ""
     list_id: str = ""
+    parent: str | None = None
+    subtask_ids: list[str] = field(default_factory=list)
+    depends_on: list[str] = field(default_factory=list)
+    blocking: list[str] = field(default_factory=list)
 
     @classmethod
     def from_api(cls, data: dict) -> Task:
+        dependencies = data.get("dependencies", [])
         return cls(
             id=data["id"],
             name=data["name"],
             status=data.get("status", {}).get("status", ""),
             assignees=[a.get("username", a.get("email", "")) for a in data.get("assignees", [])],
+            assignee_ids=[a["id"] for a in data.get("assignees", []) if "id" in a],
             priority=data.get("priority", {}).get("priority") if data.get("priority") else None,
             due_date=data.get("due_date"),
             time_estimate=data.get("time_estimate"),
@@ -71,4 +78,9 @@ class Task:
             description=data.get("description", ""),
             url=data.get("url", ""),
             list_id=data.get("list", {}).get("id", ""),
+            parent=data.get("parent"),
+            subtask_ids=[s["id"] for s in data.get("subtasks", [])],
+            # A dependency {task_id: A, depends_on: B} means A is waiting on B.
+            depends_on=[d["depends_on"] for d in dependencies if d.get("task_id") == data["id"]],
+            blocking=[d["task_id"] for d in dependencies if d.get("depends_on") == data["id"]],
         )
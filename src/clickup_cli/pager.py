@@ -0,0 +1,231 @@
+"""Interactive, virtualized task table for large result sets.
+
+Only the rows in the current viewport are put into a ``rich`` table, and
+each task's cells are formatted once and cached. Pages are loaded on a
+background thread so the view is usable before every page has arrived.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterable
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+from clickup_cli.formatting import PRIORITY_RANK, TASK_COLUMNS, print_tasks, task_row
+from clickup_cli.models import Task
+
+console = Console()
+
+# Lines used by everything other than task rows: title, top border, header,
+# header separator, bottom border and the status line.
+CHROME_LINES = 6
+
+HELP = "j/k ↑/↓ scroll  space/b page  g/G top/end  / search  s sort  r reverse  q quit"
+
+
+def _due_key(t: Task) -> float:
+    try:
+        return int(t.due_date) if t.due_date else float("inf")
+    except ValueError:
+        return float("inf")
+
+
+SORT_KEYS = {
+    "ID": lambda t: t.id,
+    "Name": lambda t: t.name.lower(),
+    "Status": lambda t: t.status.lower(),
+    "Priority": lambda t: PRIORITY_RANK.get(t.priority or "", 99),
+    "Assignees": lambda t: ", ".join(t.assignees).lower(),
+    "Due Date": _due_key,
+    "Estimate": lambda t: t.time_estimate or 0,
+    "Tags": lambda t: ", ".join(t.tags).lower(),
+}
+
+KEYS = {
+    b"\x1b[A": "up",
+    b"\x1b[B": "down",
+    b"\x1b[5~": "pgup",
+    b"\x1b[6~": "pgdn",
+    b"\x1b[H": "home",
+    b"\x1b[F": "end",
+    b"\r": "enter",
+    b"\n": "enter",
+    b"\x1b": "esc",
+    b"\x7f": "backspace",
+}
+
+
+@contextmanager
+def _cbreak(fd: int):
+    # POSIX-only; imported here so merely loading the module works everywhere.
+    import termios
+    import tty
+
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def _read_key(fd: int, timeout: float) -> str | None:
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return None
+    data = os.read(fd, 32)
+    return KEYS.get(data, data.decode(errors="ignore"))
+
+
+class TaskPager:
+    def __init__(self, pages: Iterable[list[Task]], title: str = "Tasks"):
+        self._pages = pages
+        self._title = title
+        self._tasks: list[Task] = []
+        self._rows: dict[int, tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+        self._loaded = 0
+        self._done = False
+        self._error: str | None = None
+        self._offset = 0
+        self._sort_col: int | None = None
+        self._reverse = False
+        self._query = ""
+        self._typing: str | None = None
+        self._view: list[Task] = []
+        self._view_key: tuple | None = None
+
+    def _load(self) -> None:
+        try:
+            for tasks in self._pages:
+                with self._lock:
+                    self._tasks.extend(tasks)
+                    self._loaded += 1
+        except SystemExit:
+            self._error = "Loading stopped: API request failed."
+        finally:
+            self._done = True
+
+    def _row(self, task: Task) -> tuple[str, ...]:
+        row = self._rows.get(id(task))
+        if row is None:
+            row = self._rows[id(task)] = task_row(task)
+        return row
+
+    def _visible(self) -> list[Task]:
+        with self._lock:
+            count = len(self._tasks)
+            key = (count, self._sort_col, self._reverse, self._query)
+            if key == self._view_key:
+                return self._view
+            tasks = self._tasks[:count]
+        if self._query:
+            q = self._query.lower()
+            tasks = [t for t in tasks if q in " ".join((t.id, t.name, t.status, *t.assignees, *t.tags)).lower()]
+        if self._sort_col is not None:
+            tasks = sorted(tasks, key=SORT_KEYS[TASK_COLUMNS[self._sort_col][0]], reverse=self._reverse)
+        elif self._reverse:
+            tasks = tasks[::-1]
+        self._view, self._view_key = tasks, key
+        return tasks
+
+    def _height(self) -> int:
+        return max(1, console.size.height - CHROME_LINES)
+
+    def _render(self) -> Group:
+        view = self._visible()
+        height = self._height()
+        self._offset = max(0, min(self._offset, len(view) - height))
+        window = view[self._offset:self._offset + height]
+
+        table = Table(title=self._title, expand=True)
+        for i, (name, style) in enumerate(TASK_COLUMNS):
+            if i == self._sort_col:
+                name = f"{name} {'▼' if self._reverse else '▲'}"
+            table.add_column(name, style=style, no_wrap=True, overflow="ellipsis")
+        for t in window:
+            table.add_row(*self._row(t))
+
+        if self._typing is not None:
+            status = Text(f"/{self._typing}", style="bold")
+        else:
+            first = self._offset + 1 if window else 0
+            status = Text(f"{first}-{self._offset + len(window)} of {len(view)}", style="bold")
+            if self._query:
+                status.append(f"  filter: {self._query}", style="cyan")
+            if self._error:
+                status.append(f"  {self._error}", style="red")
+            elif not self._done:
+                status.append(f"  loading (page {self._loaded})...", style="yellow")
+            status.append(f"  {HELP}", style="dim")
+        return Group(table, status)
+
+    def _handle(self, key: str) -> bool:
+        """Apply a key press. Returns False when the pager should close."""
+        if self._typing is not None:
+            if key == "enter":
+                self._query, self._typing = self._typing, None
+                self._offset = 0
+            elif key == "esc":
+                self._typing = None
+            elif key == "backspace":
+                self._typing = self._typing[:-1]
+            elif len(key) == 1 and key.isprintable():
+                self._typing += key
+            return True
+
+        height = self._height()
+        if key in ("q", "Q"):
+            return False
+        if key in ("j", "down"):
+            self._offset += 1
+        elif key in ("k", "up"):
+            self._offset -= 1
+        elif key in (" ", "f", "pgdn"):
+            self._offset += height
+        elif key in ("b", "pgup"):
+            self._offset -= height
+        elif key in ("g", "home"):
+            self._offset = 0
+        elif key in ("G", "end"):
+            self._offset = len(self._visible())
+        elif key == "/":
+            self._typing = ""
+        elif key == "esc":
+            self._query = ""
+        elif key == "s":
+            self._sort_col = 0 if self._sort_col is None else (self._sort_col + 1) % len(TASK_COLUMNS)
+        elif key == "r":
+            self._reverse = not self._reverse
+        self._offset = max(0, self._offset)
+        return True
+
+    def run(self) -> None:
+        fd = sys.stdin.fileno()
+        threading.Thread(target=self._load, daemon=True).start()
+        rendered = None
+        with _cbreak(fd), Live(self._render(), console=console, screen=True, auto_refresh=False) as live:
+            while True:
+                key = _read_key(fd, timeout=0.1)
+                if key is not None and not self._handle(key):
+                    break
+                state = (key, self._loaded, self._done, console.size)
+                if key is not None or state != rendered:
+                    live.update(self._render(), refresh=True)
+                    rendered = state
+
+
+def page_tasks(pages: Iterable[list[Task]], title: str = "Tasks") -> None:
+    """Show tasks in the interactive pager, or as a plain table when not on a terminal."""
+    if not (console.is_terminal and sys.stdin.isatty()):
+        print_tasks([t for tasks in pages for t in tasks])
+        return
+    TaskPager(pages, title).run()
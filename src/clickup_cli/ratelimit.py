@@ -0,0 +1,120 @@
+"""Per-token request budget shared by every CLI process on the host.
+
+The token bucket for an API token lives in a small JSON file under
+``~/.clickup-cli/ratelimit/`` and is only read or updated while holding an
+exclusive lock on it, so parallel ``cl`` invocations (and threads within one)
+draw from the same budget instead of each assuming the full limit.
+
+The budget starts at ClickUp's lowest-plan limit and is raised or lowered to
+whatever ``X-RateLimit-Limit`` the API reports. Setting ``CLICKUP_RATE_LIMIT``
+pins it to a fixed number of requests per minute instead.
+
+Only a tenth of the limit can be sent in a burst; the rest refills evenly
+over the period. That way no window of ``period`` seconds, including
+ClickUp's fixed per-minute windows, sees more than the limit in total.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from clickup_cli.config import CONFIG_DIR
+from clickup_cli.locking import file_lock
+
+RATE_LIMIT_DIR = CONFIG_DIR / "ratelimit"
+
+# ClickUp's per-token limit on the lowest plan.
+DEFAULT_RATE_LIMIT = 100
+RATE_LIMIT_PERIOD = 60.0
+RATE_LIMIT_ENV = "CLICKUP_RATE_LIMIT"
+# The bucket holds at most 1/BURST_DIVISOR of the limit.
+BURST_DIVISOR = 10
+
+
+def _burst(rate: int) -> int:
+    return max(1, rate // BURST_DIVISOR)
+
+
+def _refill(rate: int) -> int:
+    """Tokens added per period, so that a full burst plus refill fits the limit."""
+    return max(1, rate - _burst(rate))
+
+
+class RateLimiter:
+    """Token bucket allowing at most ``rate`` requests in any ``period`` seconds per API token."""
+
+    def __init__(
+        self,
+        api_token: str,
+        rate: int | None = None,
+        period: float = RATE_LIMIT_PERIOD,
+        state_dir: Path = RATE_LIMIT_DIR,
+    ):
+        # Only a digest of the token ends up on disk.
+        name = hashlib.sha256(api_token.encode()).hexdigest()[:16]
+        self._state_file = state_dir / f"{name}.json"
+        self._lock_file = state_dir / f"{name}.lock"
+        if rate is None and os.environ.get(RATE_LIMIT_ENV, "").isdigit():
+            rate = int(os.environ[RATE_LIMIT_ENV])
+        # An explicit rate is never overridden by what the API reports.
+        self._fixed = rate is not None
+        self._rate = rate or DEFAULT_RATE_LIMIT
+        self._period = period
+
+    def _bucket_rate(self, state: dict) -> int:
+        return self._rate if self._fixed else state.get("rate", self._rate)
+
+    def _read(self, now: float) -> dict:
+        try:
+            with open(self._state_file) as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {"tokens": float(_burst(self._rate)), "updated": now}
+        rate = self._bucket_rate(state)
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(float(_burst(rate)), state["tokens"] + elapsed * _refill(rate) / self._period)
+        state["updated"] = max(now, state["updated"])
+        return state
+
+    def _write(self, state: dict) -> None:
+        with open(self._state_file, "w") as f:
+            json.dump(state, f)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then consume one token."""
+        while True:
+            with file_lock(self._lock_file):
+                now = time.time()
+                state = self._read(now)
+                if state["tokens"] >= 1 and state["updated"] <= now:
+                    state["tokens"] -= 1
+                    self._write(state)
+                    return
+                self._write(state)
+                fill_rate = _refill(self._bucket_rate(state)) / self._period
+                wait = max(state["updated"] - now, 0.0) + max(1 - state["tokens"], 0.0) / fill_rate
+            # Sleep without the lock so other processes can check in meanwhile.
+            time.sleep(wait)
+
+    def backoff(self, until: float) -> None:
+        """Empty the bucket until ``until`` (epoch seconds) after the API refused a request."""
+        with file_lock(self._lock_file):
+            state = self._read(time.time())
+            state["tokens"] = 0.0
+            state["updated"] = max(state["updated"], until)
+            self._write(state)
+
+    def update_rate(self, rate: int) -> None:
+        """Adopt the per-token limit reported by the API for every process."""
+        if self._fixed or rate <= 0 or rate == self._rate:
+            return
+        with file_lock(self._lock_file):
+            state = self._read(time.time())
+            state["rate"] = rate
+            state["tokens"] = min(state["tokens"], float(_burst(rate)))
+            self._write(state)
+        self._rate = rate
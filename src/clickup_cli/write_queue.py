@@ -0,0 +1,275 @@
+"""Durable local queue for task mutations that are sent to ClickUp later."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from clickup_cli.client import ClickUpAPIError, ClickUpClient
+from clickup_cli.config import CONFIG_DIR, load_config, require_token
+from clickup_cli.locking import file_lock
+
+QUEUE_FILE = CONFIG_DIR / "queue.json"
+QUEUE_LOCK = CONFIG_DIR / "queue.lock"
+FLUSH_LOCK = CONFIG_DIR / "queue-flush.lock"
+
+PENDING = "pending"
+SENDING = "sending"
+CONFLICT = "conflict"
+
+
+def _load() -> list[dict]:
+    if not QUEUE_FILE.exists():
+        return []
+    with open(QUEUE_FILE) as f:
+        return json.load(f)
+
+
+def _save(entries: list[dict]) -> None:
+    tmp = QUEUE_FILE.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(entries, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, QUEUE_FILE)
+
+
+def _key(entry: dict) -> str:
+    """Entries sharing a key are sent strictly in queue order."""
+    if entry["op"] == "update":
+        return f"task:{entry['task_id']}"
+    return f"entry:{entry['id']}"
+
+
+def _new_entry(op: str, data: dict, profile: str | None, **target) -> dict:
+    return {
+        "id": uuid.uuid4().hex[:8],
+        "op": op,
+        "profile": profile,
+        **target,
+        "data": data,
+        "status": PENDING,
+        "queued_at": int(time.time()),
+        "attempts": 0,
+        "error": None,
+    }
+
+
+def _merge_assignees(current: dict, new: dict) -> dict:
+    add = [a for a in current.get("add", []) if a not in new.get("rem", [])]
+    rem = [r for r in current.get("rem", []) if r not in new.get("add", [])]
+    add += [a for a in new.get("add", []) if a not in add]
+    rem += [r for r in new.get("rem", []) if r not in rem]
+    merged = {}
+    if add:
+        merged["add"] = add
+    if rem:
+        merged["rem"] = rem
+    return merged
+
+
+def merge_updates(current: dict, new: dict) -> dict:
+    """Fold a later update payload into an earlier one for the same task."""
+    merged = {**current, **new}
+    if "assignees" in current and "assignees" in new:
+        assignees = _merge_assignees(current["assignees"], new["assignees"])
+        if assignees:
+            merged["assignees"] = assignees
+        else:
+            del merged["assignees"]
+    return merged
+
+
+def list_entries() -> list[dict]:
+    with file_lock(QUEUE_LOCK):
+        return _load()
+
+
+def enqueue_create(list_id: str, task_data: dict, profile: str | None = None) -> dict:
+    """Queue a task creation. Creates are never coalesced."""
+    with file_lock(QUEUE_LOCK):
+        entries = _load()
+        entry = _new_entry("create", task_data, profile, list_id=list_id)
+        entries.append(entry)
+        _save(entries)
+    return entry
+
+
+def enqueue_update(task_id: str, task_data: dict, profile: str | None = None) -> dict:
+    """Queue a task update, merging it into a pending update for the same task.
+
+    Only the most recent entry for the task is a merge candidate, and only
+    while it is still pending and queued under the same profile, so per-task
+    ordering is preserved and an in-flight request is never modified.
+    """
+    with file_lock(QUEUE_LOCK):
+        entries = _load()
+        last = next((e for e in reversed(entries) if e.get("task_id") == task_id), None)
+        if (
+            last is not None
+            and last["op"] == "update"
+            and last["status"] == PENDING
+            and last.get("profile") == profile
+        ):
+            last["data"] = merge_updates(last["data"], task_data)
+            entry = last
+        else:
+            entry = _new_entry("update", task_data, profile, task_id=task_id)
+            entries.append(entry)
+        _save(entries)
+    return entry
+
+
+def drop_entry(entry_id: str) -> bool:
+    with file_lock(QUEUE_LOCK):
+        entries = _load()
+        remaining = [e for e in entries if e["id"] != entry_id]
+        if len(remaining) == len(entries):
+            return False
+        _save(remaining)
+    return True
+
+
+def clear_queue() -> int:
+    with file_lock(QUEUE_LOCK):
+        count = len(_load())
+        _save([])
+    return count
+
+
+@dataclass
+class FlushResult:
+    sent: list[dict] = field(default_factory=list)
+    conflicts: list[dict] = field(default_factory=list)
+    deferred: list[dict] = field(default_factory=list)
+    busy: bool = False
+
+
+def _claim_next(blocked: set[str], retry_conflicts: bool) -> dict | None:
+    """Mark the next sendable entry as in flight and return a copy of it."""
+    with file_lock(QUEUE_LOCK):
+        entries = _load()
+        for entry in entries:
+            key = _key(entry)
+            if key in blocked:
+                continue
+            if entry["status"] == CONFLICT and not retry_conflicts:
+                blocked.add(key)
+                continue
+            entry["status"] = SENDING
+            entry["attempts"] += 1
+            _save(entries)
+            return dict(entry)
+    return None
+
+
+def _status_after(entry: dict, error: ClickUpAPIError) -> str:
+    """Whether a failed entry is safe to resend automatically.
+
+    Updates are idempotent PUTs, but a create that may have reached ClickUp
+    would be duplicated, so it waits for an explicit --retry-conflicts. That
+    includes a create answered with a 5xx, which a gateway may return after
+    ClickUp has already created the task.
+    """
+    if not error.retryable:
+        return CONFLICT
+    if entry["op"] == "create" and (error.maybe_delivered or (error.status_code or 0) >= 500):
+        return CONFLICT
+    return PENDING
+
+
+def _finish(entry_id: str, error: Exception | None, status: str | None = None) -> None:
+    with file_lock(QUEUE_LOCK):
+        entries = _load()
+        if error is None:
+            entries = [e for e in entries if e["id"] != entry_id]
+        else:
+            for e in entries:
+                if e["id"] == entry_id:
+                    e["status"] = status
+                    e["error"] = str(error)
+        _save(entries)
+
+
+def _send(client: ClickUpClient, entry: dict) -> None:
+    if entry["op"] == "create":
+        client.create_task(entry["list_id"], entry["data"], raise_errors=True)
+    else:
+        client.update_task(entry["task_id"], entry["data"], raise_errors=True)
+
+
+def _client_for(profile: str | None, clients: dict[str | None, ClickUpClient]) -> ClickUpClient:
+    """One client per config profile, created on first use."""
+    if profile not in clients:
+        clients[profile] = ClickUpClient(require_token(load_config(profile)))
+    return clients[profile]
+
+
+def flush_queue(retry_conflicts: bool = False, wait: bool = False) -> FlushResult:
+    """Send queued entries in order, each with the profile it was queued under.
+
+    A rejected entry (4xx other than 429) becomes a conflict and holds back
+    later entries for the same task, as does a create whose outcome is
+    unknown (no response, or a 5xx). Other transient failures leave the
+    entry pending for the next flush; without a response the flush stops.
+    An entry whose profile can no longer be loaded becomes a conflict.
+
+    If another flush is running, returns with ``busy`` set, or with ``wait``
+    waits for it to finish and then flushes whatever it left behind. The
+    running flush may already have checked the queue for the last time, so
+    an entry queued meanwhile would otherwise wait for a manual flush.
+    """
+    result = FlushResult()
+    with file_lock(FLUSH_LOCK, blocking=wait) as acquired:
+        if not acquired:
+            result.busy = True
+            return result
+
+        # Only one flusher runs at a time, so anything still marked as in
+        # flight was left behind by an interrupted flush. An interrupted
+        # create may already exist in ClickUp, so it is not resent blindly.
+        with file_lock(QUEUE_LOCK):
+            entries = _load()
+            for e in entries:
+                if e["status"] != SENDING:
+                    continue
+                if e["op"] == "create":
+                    e["status"] = CONFLICT
+                    e["error"] = "Flush was interrupted while sending; the task may already have been created."
+                else:
+                    e["status"] = PENDING
+            _save(entries)
+
+        clients: dict[str | None, ClickUpClient] = {}
+        blocked: set[str] = set()
+        while (entry := _claim_next(blocked, retry_conflicts)) is not None:
+            try:
+                client = _client_for(entry.get("profile"), clients)
+            except (FileNotFoundError, ValueError) as e:
+                _finish(entry["id"], e, CONFLICT)
+                blocked.add(_key(entry))
+                entry["status"] = CONFLICT
+                entry["error"] = str(e)
+                result.conflicts.append(entry)
+                continue
+            try:
+                _send(client, entry)
+            except ClickUpAPIError as e:
+                status = _status_after(entry, e)
+                _finish(entry["id"], e, status)
+                blocked.add(_key(entry))
+                entry["status"] = status
+                entry["error"] = str(e)
+                if status == PENDING:
+                    result.deferred.append(entry)
+                else:
+                    result.conflicts.append(entry)
+                if e.status_code is None:
+                    break
+                continue
+            _finish(entry["id"], None)
+            result.sent.append(entry)
+    return result